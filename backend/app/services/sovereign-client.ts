@@ -42,6 +42,7 @@ export interface ReasonResponse {
       epistemic_level: string;
       verifiability: string;
       confidence: number;
+      verification_profile: string;
       truth_floor_match: string | null;
     };
     think: any;
@@ -94,6 +95,7 @@ export interface ClassifyResponse {
     epistemic_level: string;
     verifiability: string;
     confidence: number;
+    verification_profile: string;
   };
 }
 
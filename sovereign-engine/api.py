@@ -4,39 +4,80 @@ Sovereign Reasoning Engine - REST API
 FastAPI wrapper exposing the reasoning engine as HTTP endpoints.
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Optional, Dict, Any, Tuple
+import logging
+import orjson
+import threading
+import time
+import anyio
 import uvicorn
 import os
 
 from sovereign_reasoning_engine import (
     SovereignReasoningEngine,
+    close_cached_engines,
+    get_cached_engine,
+    is_cacheable_result,
+    stamp_cached_result,
     sovereign_reason,
     verify_truth_floor_integrity,
     TRUTH_FLOOR
 )
 
+logger = logging.getLogger(__name__)
+
+# Worker threads available to blocking engine calls (anyio default is 40)
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "128"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks."""
+    # The engine is synchronous and a /reason call can block on LLM I/O for
+    # tens of seconds, so size the threadpool for many concurrent requests.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+    # Release pooled LLM connections
+    if _engine is not None:
+        _engine.close()
+    close_cached_engines()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Sovereign Reasoning Engine API",
     description="Truth-Native LLM Reasoning System with 8-Stage Protocol and 13 Truth Tiers",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS middleware
+# CORS middleware (comma-separated CORS_ORIGIN; the API uses no cookies)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=[origin.strip() for origin in os.getenv("CORS_ORIGIN", "*").split(",")],
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # let browsers cache preflights for a day
 )
 
+# Compress JSON-heavy responses (/reason carries every stage trace)
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=6)
+
 # Request/Response models
 class ReasonRequest(BaseModel):
     """Request to reason about a problem."""
+    model_config = ConfigDict(extra="ignore")
+
     input: str
     provider: Optional[str] = None
     model: Optional[str] = None
@@ -44,8 +85,11 @@ class ReasonRequest(BaseModel):
 
 class ReasonResponse(BaseModel):
     """Response from reasoning engine."""
+    model_config = ConfigDict(extra="ignore")
+
     input: str
     response: str
+    # Untyped dicts: pydantic-core passes the stage values through as-is
     stages: Dict[str, Any]
     metadata: Dict[str, Any]
 
@@ -65,6 +109,126 @@ def get_engine() -> SovereignReasoningEngine:
         _engine = SovereignReasoningEngine()
     return _engine
 
+def _has_custom_engine(request: ReasonRequest) -> bool:
+    """Whether the request overrides the provider, key or model."""
+    return bool(request.provider or request.api_key or request.model)
+
+def get_request_engine(request: ReasonRequest) -> SovereignReasoningEngine:
+    """Get the engine for a request: custom if it overrides any settings."""
+    if _has_custom_engine(request):
+        # Reuse engines (and their pooled clients) across requests
+        return get_cached_engine(
+            provider=request.provider,
+            api_key=request.api_key,
+            model=request.model
+        )
+    return get_engine()
+
+# =============================================================================
+# SEMANTIC CACHE
+# =============================================================================
+# Serves paraphrases of recently answered inputs without re-running the
+# 8-stage cycle. Opt-in (SEMANTIC_CACHE=1): it needs sentence-transformers,
+# loads an embedding model in every worker, and near-duplicate embeddings can
+# span a negation. Disabled if the model can't be loaded.
+
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE", "0") == "1"
+SEMANTIC_CACHE_MODEL = os.getenv("SEMANTIC_CACHE_MODEL", "all-MiniLM-L6-v2")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.87"))
+SEMANTIC_CACHE_SIZE = int(os.getenv("SEMANTIC_CACHE_SIZE", "10000"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+
+class SemanticCache:
+    """LRU cache of /reason results keyed by input embedding."""
+
+    def __init__(self, model_name: str, threshold: float, maxsize: int, ttl: float):
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        self._np = np
+        self._model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # matrix row -> (result, expiry)
+        self._lock = threading.Lock()
+        # (maxsize, dim) embedding matrix, allocated by the first put; each put
+        # writes one row in place. Rows [0, _rows) have been used, _free lists
+        # rows whose entries expired.
+        self._matrix = None
+        self._rows = 0
+        self._free = []
+
+    def lookup(self, text: str) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """
+        Embed text and find the most similar cached input.
+
+        Returns (embedding, result); result is None on a miss and otherwise a
+        private copy. Embeddings are unit vectors, so one matrix product gives
+        every cosine similarity.
+        """
+        embedding = self._model.encode(text, normalize_embeddings=True)
+        with self._lock:
+            if not self._entries:
+                return embedding, None
+
+            sims = self._matrix[:self._rows] @ embedding
+            best = int(sims.argmax())
+            if sims[best] < self.threshold or best not in self._entries:
+                return embedding, None
+
+            result, expiry = self._entries[best]
+            if expiry <= time.monotonic():
+                del self._entries[best]
+                self._release(best)
+                return embedding, None
+            self._entries.move_to_end(best)
+            return embedding, deepcopy(result)
+
+    def put(self, embedding, result: Dict[str, Any]) -> None:
+        """Store a result, reusing the least recently used entry's row when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = self._np.zeros((self.maxsize, embedding.shape[0]), dtype=embedding.dtype)
+            if self._free:
+                row = self._free.pop()
+            elif self._rows < self.maxsize:
+                row = self._rows
+                self._rows += 1
+            else:
+                row, _ = self._entries.popitem(last=False)
+            self._matrix[row] = embedding
+            self._entries[row] = (result, time.monotonic() + self.ttl)
+
+    def _release(self, row: int) -> None:
+        # Zeroed rows score 0, so a stale embedding can't outrank live ones
+        self._matrix[row] = 0
+        self._free.append(row)
+
+_semantic_cache: Optional[SemanticCache] = None
+_semantic_cache_unavailable = not SEMANTIC_CACHE_ENABLED
+_semantic_cache_lock = threading.Lock()
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get or create the semantic cache; None if disabled or unavailable."""
+    global _semantic_cache, _semantic_cache_unavailable
+    if _semantic_cache is None and not _semantic_cache_unavailable:
+        # One model load even when cold-start requests arrive together
+        with _semantic_cache_lock:
+            if _semantic_cache is None and not _semantic_cache_unavailable:
+                try:
+                    _semantic_cache = SemanticCache(
+                        SEMANTIC_CACHE_MODEL, SEMANTIC_CACHE_THRESHOLD,
+                        SEMANTIC_CACHE_SIZE, SEMANTIC_CACHE_TTL
+                    )
+                except Exception:
+                    # Not installed, or the model can't be fetched (offline)
+                    logger.exception("Semantic cache disabled: could not load %s", SEMANTIC_CACHE_MODEL)
+                    _semantic_cache_unavailable = True
+    return _semantic_cache
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -77,6 +241,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /reason": "Execute 8-stage reasoning on input",
+            "POST /reason/stream": "Execute 8-stage reasoning, streaming stages as SSE",
             "GET /health": "Health check and Truth Floor verification",
             "GET /truth-floor": "Get Truth Floor axioms",
             "GET /tiers": "Get 13 Truth Tiers information"
@@ -152,20 +317,24 @@ async def reason(request: ReasonRequest):
     Stages: AWARE → ENERGIZE → RECOGNIZE → THINK → SOLVE → ACT → ATTAIN → REST
     """
     try:
-        # Get or create engine
-        if request.provider or request.api_key or request.model:
-            # Create custom engine with provided parameters
-            engine = SovereignReasoningEngine(
-                provider=request.provider,
-                api_key=request.api_key,
-                model=request.model
-            )
-        else:
-            # Use global engine
-            engine = get_engine()
-
-        # Execute reasoning
-        result = engine.reason(request.input)
+        # A cold engine builds its SDK client; keep that off the event loop
+        engine = await run_in_threadpool(get_request_engine, request)
+
+        # Only the global engine's results are semantically cached
+        cache = None
+        if not _has_custom_engine(request):
+            cache = await run_in_threadpool(get_semantic_cache)
+
+        if cache is not None:
+            embedding, cached = await run_in_threadpool(cache.lookup, request.input)
+            if cached is not None:
+                return ReasonResponse(**stamp_cached_result(cached, request.input))
+
+        # Execute reasoning off the event loop (blocking LLM I/O)
+        result = await run_in_threadpool(engine.reason, request.input)
+
+        if cache is not None and is_cacheable_result(result):
+            cache.put(embedding, result)
 
         return ReasonResponse(**result)
 
@@ -175,6 +344,38 @@ async def reason(request: ReasonRequest):
             detail=f"Reasoning failed: {str(e)}"
         )
 
+@app.post("/reason/stream")
+async def reason_stream(request: ReasonRequest):
+    """
+    Execute the 8-stage reasoning cycle, streaming stages as Server-Sent Events.
+
+    Each event is one completed stage ({"stage", "data"}); the last is
+    {"stage": "complete", "result"} with the same body /reason returns.
+    """
+    try:
+        engine = await run_in_threadpool(get_request_engine, request)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Reasoning failed: {str(e)}"
+        )
+
+    def events():
+        try:
+            for event in engine.reason_stream(request.input, stream_tokens=True):
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+        except Exception as e:
+            error = {"stage": "error", "detail": f"Reasoning failed: {str(e)}"}
+            yield b"data: " + orjson.dumps(error) + b"\n\n"
+
+    # Sync generator: Starlette pulls each stage in the threadpool. Identity
+    # encoding keeps GZipMiddleware from buffering events inside the stream.
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity"}
+    )
+
 @app.post("/classify")
 async def classify_text(request: Dict[str, str]):
     """
@@ -183,14 +384,13 @@ async def classify_text(request: Dict[str, str]):
     This is faster than /reason as it skips the full 8-stage cycle.
     """
     try:
-        from sovereign_reasoning_engine import TTOClassifier
+        from sovereign_reasoning_engine import DEFAULT_CLASSIFIER as classifier
 
         text = request.get("text", "")
         if not text:
             raise HTTPException(status_code=400, detail="Text is required")
 
-        classifier = TTOClassifier()
-        classification = classifier.classify(text)
+        classification = await run_in_threadpool(classifier.classify, text)
 
         return {
             "text": text,
@@ -209,10 +409,16 @@ async def classify_text(request: Dict[str, str]):
 
 if __name__ == "__main__":
     port = int(os.getenv("PORT", "8888"))
+    dev = os.getenv("DEV") == "1"
+    # Caches are per worker process; reload only supports a single worker
+    workers = 1 if dev else int(os.getenv("WORKERS", os.cpu_count() or 1))
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=port,
-        reload=True,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        reload=dev,
         log_level="info"
     )
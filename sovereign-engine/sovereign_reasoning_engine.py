@@ -14,12 +14,22 @@ import os
 import re
 import json
 import hashlib
+import logging
+import orjson
+import sqlite3
 import time
+import threading
+from copy import deepcopy
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # LLM CLIENT CONFIGURATION
 # =============================================================================
@@ -29,39 +39,68 @@ LLM_PROVIDER = os.getenv("LLM_PROVIDER", "openai")  # openai, xai, anthropic, ol
 LLM_API_KEY = os.getenv("LLM_API_KEY", "")
 LLM_MODEL = os.getenv("LLM_MODEL", "gpt-4")  # gpt-4, grok-3, claude-3, gemma3:27b
 
-def get_llm_client():
+def get_llm_client(provider: str = None, api_key: str = None):
     """Initialize the appropriate LLM client based on provider."""
-    if LLM_PROVIDER == "openai":
+    provider = provider or LLM_PROVIDER
+    api_key = api_key or LLM_API_KEY
+
+    if provider == "openai":
         import openai
-        return openai.OpenAI(api_key=LLM_API_KEY)
-    elif LLM_PROVIDER == "xai":
+        return openai.OpenAI(api_key=api_key)
+    elif provider == "xai":
         import openai
         return openai.OpenAI(
-            api_key=LLM_API_KEY,
+            api_key=api_key,
             base_url="https://api.x.ai/v1"
         )
-    elif LLM_PROVIDER == "anthropic":
+    elif provider == "anthropic":
         import anthropic
-        return anthropic.Anthropic(api_key=LLM_API_KEY)
-    elif LLM_PROVIDER == "ollama":
+        return anthropic.Anthropic(api_key=api_key)
+    elif provider == "ollama":
         return OllamaClient()
     else:
-        raise ValueError(f"Unknown LLM provider: {LLM_PROVIDER}")
+        raise ValueError(f"Unknown LLM provider: {provider}")
 
 class OllamaClient:
     """Local Ollama client wrapper."""
     def __init__(self, host="localhost", port=11434):
+        import httpx
         self.base_url = f"http://{host}:{port}"
-
-    def chat(self, model, messages, temperature=0.7):
-        import requests
-        resp = requests.post(
-            f"{self.base_url}/api/chat",
-            json={"model": model, "messages": messages, "stream": False},
-            timeout=60
+        # Pooled keep-alive connections, reused across calls and THINK threads
+        self._http = httpx.Client(
+            base_url=self.base_url,
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=16)
         )
+
+    def chat(self, model, messages, temperature=0.7, format=None):
+        payload = {"model": model, "messages": messages, "stream": False}
+        if format:
+            payload["format"] = format
+        resp = self._http.post("/api/chat", json=payload)
+        resp.raise_for_status()
         return resp.json()
 
+    def chat_stream(self, model, messages, temperature=0.7) -> Iterator[str]:
+        """Yield response text as Ollama generates it (NDJSON chunks)."""
+        payload = {"model": model, "messages": messages, "stream": True}
+        with self._http.stream("POST", "/api/chat", json=payload) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if line:
+                    yield json.loads(line).get("message", {}).get("content", "")
+
+    def close(self):
+        """Close pooled connections."""
+        self._http.close()
+
+    def __del__(self):
+        # Like the openai/anthropic httpx wrappers: release the pool once unreferenced
+        try:
+            self.close()
+        except Exception:
+            pass
+
 # =============================================================================
 # TRUTH FLOOR - 12 Immutable Axioms (T0 Verification)
 # =============================================================================
@@ -81,22 +120,75 @@ TRUTH_FLOOR = (
     "Verifying the Truth Floor adds zero net friction",
 )
 
-TRUTH_FLOOR_HASH = hashlib.sha3_256("\n".join(TRUTH_FLOOR).encode()).hexdigest()
+def _hash_truth_floor(axioms: Tuple[str, ...]) -> str:
+    """Integrity digest of the axioms (SHA-256: hardware-accelerated via OpenSSL)."""
+    return hashlib.sha256("\n".join(axioms).encode()).hexdigest()
+
+TRUTH_FLOOR_HASH = _hash_truth_floor(TRUTH_FLOOR)
+
+# TRUTH_FLOOR is a tuple of str, so it can only change by rebinding the name.
+# Re-hash only when the bound object isn't the one last verified.
+_verified_truth_floor = TRUTH_FLOOR
 
 def verify_truth_floor_integrity() -> bool:
     """Verify Truth Floor hasn't been tampered with."""
-    current = hashlib.sha3_256("\n".join(TRUTH_FLOOR).encode()).hexdigest()
+    global _verified_truth_floor
+    if TRUTH_FLOOR is _verified_truth_floor:
+        return True
+
+    current = _hash_truth_floor(TRUTH_FLOOR)
     if current != TRUTH_FLOOR_HASH:
         raise RuntimeError("CRITICAL: Truth Floor integrity compromised!")
+    _verified_truth_floor = TRUTH_FLOOR
     return True
 
+_AXIOM_STOPWORDS = frozenset({"the", "a", "is", "of", "in", "to", "and", "an"})
+
+# Axioms are immutable, so their significant words (and the 60% of them a
+# claim must share to match) are computed once
+_AXIOM_WORDSETS = tuple(
+    (axiom, words, len(words) * 0.6)
+    for axiom, words in (
+        (axiom, frozenset(axiom.lower().split()) - _AXIOM_STOPWORDS)
+        for axiom in TRUTH_FLOOR
+    )
+)
+
+# Most hits quote an axiom outright; these answer that before word scoring
+_AXIOM_EXACT = {axiom.lower(): axiom for axiom in TRUTH_FLOOR}
+# Whole-axiom quotes must sit on word boundaries, so "e is transcendental"
+# doesn't match inside "life is transcendental"
+_AXIOM_QUOTE_RES = tuple(
+    (re.compile(r'(?<!\w)' + re.escape(axiom.lower()) + r'(?!\w)'), axiom)
+    for axiom in TRUTH_FLOOR
+)
+
+_TOKEN_PUNCTUATION = ".,;:!?\"'()"
+
 def check_truth_floor(claim: str) -> Optional[str]:
     """Check if claim matches any Truth Floor axiom."""
-    claim_lower = claim.lower()
-    for axiom in TRUTH_FLOOR:
-        axiom_words = set(axiom.lower().split()) - {"the", "a", "is", "of", "in", "to", "and", "an"}
-        matches = sum(1 for w in axiom_words if w in claim_lower)
-        if matches >= len(axiom_words) * 0.6:
+    return _match_truth_floor(claim.lower())
+
+def _is_exact_axiom(claim_lower: str, axiom: str) -> bool:
+    """Whether the whole claim is the axiom, up to case and trailing punctuation."""
+    return _AXIOM_EXACT.get(claim_lower.strip().rstrip(_TOKEN_PUNCTUATION)) == axiom
+
+def _match_truth_floor(claim_lower: str) -> Optional[str]:
+    """check_truth_floor for an already-lowercased claim."""
+    # Fast paths: the claim is an axiom, or quotes one verbatim
+    exact = _AXIOM_EXACT.get(claim_lower.strip().rstrip(_TOKEN_PUNCTUATION))
+    if exact:
+        return exact
+    for quote_re, axiom in _AXIOM_QUOTE_RES:
+        if quote_re.search(claim_lower):
+            return axiom
+
+    # Tokenize the same way axioms are split, so "m/s" and "=" stay whole
+    # and single-letter words ("c", "e") don't match inside other words
+    claim_tokens = {w.strip(_TOKEN_PUNCTUATION) for w in claim_lower.split()}
+    for axiom, axiom_words, min_matches in _AXIOM_WORDSETS:
+        # Set intersection counts shared words in C, not a Python loop
+        if len(axiom_words & claim_tokens) >= min_matches:
             return axiom
     return None
 
@@ -125,6 +217,25 @@ class TruthTier(Enum):
         self.tier_name = name
         self.resistance = resistance
 
+class VerificationProfile(Enum):
+    """Which verification strategy a tier gets in the SOLVE cascade."""
+    AXIOM = "axiom"                # T0
+    MATH_LOGIC = "math_logic"      # T1-T2
+    EMPIRICAL = "empirical"        # T3-T5
+    CONTEXTUAL = "contextual"      # T6-T8
+    SPECULATIVE = "speculative"    # T9-T11
+    VIOLATION = "violation"        # T12
+
+# Indexed by tier number; decided once at classification time
+_TIER_PROFILES = (
+    VerificationProfile.AXIOM,
+    VerificationProfile.MATH_LOGIC, VerificationProfile.MATH_LOGIC,
+    VerificationProfile.EMPIRICAL, VerificationProfile.EMPIRICAL, VerificationProfile.EMPIRICAL,
+    VerificationProfile.CONTEXTUAL, VerificationProfile.CONTEXTUAL, VerificationProfile.CONTEXTUAL,
+    VerificationProfile.SPECULATIVE, VerificationProfile.SPECULATIVE, VerificationProfile.SPECULATIVE,
+    VerificationProfile.VIOLATION,
+)
+
 @dataclass
 class TruthToken:
     """A classified truth token."""
@@ -227,97 +338,96 @@ class EpistemicSubject:
     access_type: str = "direct"  # "direct", "inferred", "reported"
     verifiability: str = "verifiable"  # "verifiable", "unfalsifiable", "partial"
 
+def _compile_any(patterns: List[str]) -> re.Pattern:
+    """Compile a pattern family into one alternation: a single search per family."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
 class EpistemicSubjectDetector:
     """Detects WHO is claiming WHAT and HOW they know it."""
 
-    INTROSPECTIVE_PATTERNS = [
+    INTROSPECTIVE_PATTERNS = _compile_any([
         r'\bi\s+(feel|think|believe|want|like|hate|love|prefer|know|remember)\b',
         r'\bmy\s+(opinion|view|feeling|experience|belief)\b',
         r'\bto me\b', r'\bfor me\b', r'\bi\'m\s+(sure|certain|convinced)\b'
-    ]
+    ])
 
-    TESTIMONIAL_PATTERNS = [
+    TESTIMONIAL_PATTERNS = _compile_any([
         r'\b(he|she|they|it)\s+(said|told|claimed|stated|believes|thinks)\b',
         r'\baccording to\b', r'\b\w+\s+says\b', r'\breportedly\b', r'\ballegedly\b'
-    ]
+    ])
 
-    AUTHORITY_PATTERNS = [
+    AUTHORITY_PATTERNS = _compile_any([
         r'\bscientists?\s+(say|believe|found|discovered)\b',
         r'\bresearch\s+(shows?|indicates?|suggests?)\b',
         r'\bexperts?\s+(say|believe|agree)\b',
         r'\bthe\s+study\s+(found|shows|indicates)\b'
-    ]
+    ])
 
-    APRIORI_PATTERNS = [
+    APRIORI_PATTERNS = _compile_any([
         r'\b\d+\s*[\+\-\*\/]\s*\d+\s*=\s*\d+\b',  # Full equations like 2+2=4
         r'\b\d+\s*[\+\-\*\/]\s*\d+\b',  # Partial math like 2+2
         r'\bby definition\b', r'\bnecessarily\b', r'\blogically\b',
         r'\ball\s+\w+\s+are\b', r'\bno\s+\w+\s+is\b'
-    ]
+    ])
 
-    NORMATIVE_PATTERNS = [
+    NORMATIVE_PATTERNS = _compile_any([
         r'\bshould\b', r'\bought\b', r'\bmust\b', r'\bneed to\b',
         r'\bis\s+(right|wrong|good|bad|moral|immoral)\b'
-    ]
+    ])
 
     def detect(self, text: str) -> EpistemicSubject:
         """Detect epistemic subject and level."""
         text_lower = text.lower()
 
         # Check introspective (self-knowledge)
-        for pattern in self.INTROSPECTIVE_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EpistemicSubject(
-                    subject_type="self",
-                    epistemic_level=EpistemicLevel.INTROSPECTIVE,
-                    confidence=1.0,
-                    access_type="direct",
-                    verifiability="unfalsifiable"
-                )
+        if self.INTROSPECTIVE_PATTERNS.search(text_lower):
+            return EpistemicSubject(
+                subject_type="self",
+                epistemic_level=EpistemicLevel.INTROSPECTIVE,
+                confidence=1.0,
+                access_type="direct",
+                verifiability="unfalsifiable"
+            )
 
         # Check testimonial
-        for pattern in self.TESTIMONIAL_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EpistemicSubject(
-                    subject_type="other",
-                    epistemic_level=EpistemicLevel.TESTIMONIAL,
-                    confidence=0.7,
-                    access_type="reported",
-                    verifiability="partial"
-                )
+        if self.TESTIMONIAL_PATTERNS.search(text_lower):
+            return EpistemicSubject(
+                subject_type="other",
+                epistemic_level=EpistemicLevel.TESTIMONIAL,
+                confidence=0.7,
+                access_type="reported",
+                verifiability="partial"
+            )
 
         # Check authority
-        for pattern in self.AUTHORITY_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EpistemicSubject(
-                    subject_type="authority",
-                    epistemic_level=EpistemicLevel.A_POSTERIORI,
-                    confidence=0.85,
-                    access_type="reported",
-                    verifiability="verifiable"
-                )
+        if self.AUTHORITY_PATTERNS.search(text_lower):
+            return EpistemicSubject(
+                subject_type="authority",
+                epistemic_level=EpistemicLevel.A_POSTERIORI,
+                confidence=0.85,
+                access_type="reported",
+                verifiability="verifiable"
+            )
 
         # Check a priori
-        for pattern in self.APRIORI_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EpistemicSubject(
-                    subject_type="universal",
-                    epistemic_level=EpistemicLevel.A_PRIORI,
-                    confidence=1.0,
-                    access_type="direct",
-                    verifiability="verifiable"
-                )
+        if self.APRIORI_PATTERNS.search(text_lower):
+            return EpistemicSubject(
+                subject_type="universal",
+                epistemic_level=EpistemicLevel.A_PRIORI,
+                confidence=1.0,
+                access_type="direct",
+                verifiability="verifiable"
+            )
 
         # Check normative
-        for pattern in self.NORMATIVE_PATTERNS:
-            if re.search(pattern, text_lower):
-                return EpistemicSubject(
-                    subject_type="anonymous",
-                    epistemic_level=EpistemicLevel.NORMATIVE,
-                    confidence=0.6,
-                    access_type="inferred",
-                    verifiability="partial"
-                )
+        if self.NORMATIVE_PATTERNS.search(text_lower):
+            return EpistemicSubject(
+                subject_type="anonymous",
+                epistemic_level=EpistemicLevel.NORMATIVE,
+                confidence=0.6,
+                access_type="inferred",
+                verifiability="partial"
+            )
 
         # Default: anonymous factual claim
         return EpistemicSubject(
@@ -328,29 +438,70 @@ class EpistemicSubjectDetector:
             verifiability="verifiable"
         )
 
+# Detection holds no per-call state, so one instance is shared process-wide
+DEFAULT_EPISTEMIC_DETECTOR = EpistemicSubjectDetector()
+
 # =============================================================================
 # TTO CLASSIFIER
 # =============================================================================
 
+try:
+    import ahocorasick  # pyahocorasick: C multi-pattern matcher
+except ImportError:
+    ahocorasick = None
+
+def _build_keyword_index() -> Dict[str, Tuple[str, ...]]:
+    """Inverted index: keyword -> symbols of the tokens that list it."""
+    index: Dict[str, List[str]] = {}
+    for symbol, token in TTO_TOKENS.items():
+        for kw in token.keywords:
+            index.setdefault(kw, []).append(symbol)
+    return {kw: tuple(symbols) for kw, symbols in index.items()}
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+def _build_keyword_automaton():
+    """Aho-Corasick automaton over every TTO keyword, or None if unavailable."""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for kw, symbols in _KEYWORD_INDEX.items():
+        automaton.add_word(kw, (kw, symbols))
+    automaton.make_automaton()
+    return automaton
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Epistemic levels that fix the tier regardless of the best-matching token
+_EPISTEMIC_TIER_OVERRIDES: Dict[EpistemicLevel, TruthTier] = {
+    EpistemicLevel.INTROSPECTIVE: TruthTier.T10_COGNITIVE,
+    EpistemicLevel.TESTIMONIAL: TruthTier.T8_TESTIMONIAL,
+    EpistemicLevel.SPECULATIVE: TruthTier.T11_SPECULATIVE,
+}
+
+CLASSIFY_CACHE_SIZE = 4096
+
 class TTOClassifier:
     """Classifies claims into Truth Token Ontology."""
 
     def __init__(self):
-        self.epistemic_detector = EpistemicSubjectDetector()
+        self.epistemic_detector = DEFAULT_EPISTEMIC_DETECTOR
+        # Classification depends only on the lowercased text, so repeat
+        # inputs skip the regex and keyword passes entirely
+        self._classify_cached = lru_cache(maxsize=CLASSIFY_CACHE_SIZE)(self._classify)
 
     def classify(self, text: str) -> Dict[str, Any]:
         """Classify a claim into TTO."""
-        text_lower = text.lower()
+        # Copy so callers can mutate the result without touching the cache
+        return dict(self._classify_cached(text.lower()))
 
+    def _classify(self, text_lower: str) -> Dict[str, Any]:
         # 1. Detect epistemic subject first
-        epistemic = self.epistemic_detector.detect(text)
+        epistemic = self.epistemic_detector.detect(text_lower)
 
         # 2. Score against all tokens
-        scores = {}
-        for symbol, token in TTO_TOKENS.items():
-            score = sum(1 for kw in token.keywords if kw in text_lower)
-            if score > 0:
-                scores[symbol] = score
+        scores = self._score_tokens(text_lower)
 
         # 3. Get best match
         if scores:
@@ -362,13 +513,7 @@ class TTOClassifier:
             best_token = TTO_TOKENS.get(best_symbol, TTO_TOKENS["UniversalTT"])
 
         # 4. Adjust tier based on epistemic subject
-        final_tier = best_token.tier
-        if epistemic.epistemic_level == EpistemicLevel.INTROSPECTIVE:
-            final_tier = TruthTier.T10_COGNITIVE
-        elif epistemic.epistemic_level == EpistemicLevel.TESTIMONIAL:
-            final_tier = TruthTier.T8_TESTIMONIAL
-        elif epistemic.epistemic_level == EpistemicLevel.SPECULATIVE:
-            final_tier = TruthTier.T11_SPECULATIVE
+        final_tier = _EPISTEMIC_TIER_OVERRIDES.get(epistemic.epistemic_level, best_token.tier)
 
         return {
             "symbol": best_symbol,
@@ -379,9 +524,30 @@ class TTOClassifier:
             "epistemic_subject": epistemic.subject_type,
             "epistemic_level": epistemic.epistemic_level.value,
             "verifiability": epistemic.verifiability,
-            "confidence": epistemic.confidence
+            "confidence": epistemic.confidence,
+            "verification_profile": _TIER_PROFILES[final_tier.tier_num].value
         }
 
+    def _score_tokens(self, text_lower: str) -> Dict[str, int]:
+        """Count how many of each token's keywords occur in the text."""
+        if _KEYWORD_AUTOMATON is not None:
+            # Single pass over the text; each distinct keyword counts once
+            matched = {match for _, match in _KEYWORD_AUTOMATON.iter(text_lower)}
+        else:
+            # One substring scan per distinct keyword, shared across tokens
+            matched = [(kw, symbols) for kw, symbols in _KEYWORD_INDEX.items() if kw in text_lower]
+
+        counts: Dict[str, int] = {}
+        for kw, symbols in matched:
+            for symbol in symbols:
+                counts[symbol] = counts.get(symbol, 0) + 1
+
+        # Keep TTO_TOKENS order so ties in the best-match argmax break as before
+        return {symbol: counts[symbol] for symbol in TTO_TOKENS if symbol in counts}
+
+# Stateless and thread-safe: shared by every engine and the /classify endpoint
+DEFAULT_CLASSIFIER = TTOClassifier()
+
 # =============================================================================
 # MULTIDIMENSIONAL ANALYSIS (THINK Stage)
 # =============================================================================
@@ -396,39 +562,111 @@ ANALYSIS_DIMENSIONS = [
     ("creative", "Analyze creatively. What alternative solutions exist?"),
 ]
 
+def _analyze_dimension(client, model: str, dim_prompt: str, elements: str) -> str:
+    """Run a single THINK dimension against the LLM."""
+    prompt = f"{dim_prompt}\n\nContext: {elements}\n\nProvide concise analysis (2-3 sentences)."
+
+    try:
+        if isinstance(client, OllamaClient):
+            # Ollama
+            resp = client.chat(model, [{"role": "user", "content": prompt}])
+            return resp.get("message", {}).get("content", "")
+        elif hasattr(client, 'messages'):
+            # Anthropic
+            resp = client.messages.create(
+                model=model,
+                max_tokens=200,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return resp.content[0].text
+        else:
+            # OpenAI/xAI
+            resp = client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=200,
+                temperature=0.7
+            )
+            return resp.choices[0].message.content
+    except Exception as e:
+        return f"[Analysis failed: {e}]"
+
 def multidimensional_analysis(client, model: str, elements: str) -> Dict[str, str]:
-    """THINK: Analyze from multiple cognitive dimensions."""
-    analysis = {}
+    """
+    THINK: Analyze from multiple cognitive dimensions.
+
+    The dimensions are independent network round-trips, so they are fanned
+    out concurrently: wall-clock cost is the slowest dimension, not the sum.
+    """
+    with ThreadPoolExecutor(max_workers=len(ANALYSIS_DIMENSIONS)) as executor:
+        futures = {
+            dim_name: executor.submit(_analyze_dimension, client, model, dim_prompt, elements)
+            for dim_name, dim_prompt in ANALYSIS_DIMENSIONS
+        }
+        return {dim_name: future.result() for dim_name, future in futures.items()}
 
-    for dim_name, dim_prompt in ANALYSIS_DIMENSIONS:
-        prompt = f"{dim_prompt}\n\nContext: {elements}\n\nProvide concise analysis (2-3 sentences)."
+def _is_rejected_request(exc: Exception) -> bool:
+    """
+    Whether the provider refused the request itself (HTTP 400, e.g. an
+    unsupported response_format), as opposed to a transient failure such as
+    a 429, a timeout or a dropped connection.
+    """
+    status = getattr(exc, "status_code", None)  # openai/anthropic APIStatusError
+    if status is None:
+        response = getattr(exc, "response", None)  # httpx.HTTPStatusError (Ollama)
+        status = getattr(response, "status_code", None)
+    return status == 400
 
-        try:
-            if hasattr(client, 'chat'):
-                # Ollama
-                resp = client.chat(model, [{"role": "user", "content": prompt}])
-                analysis[dim_name] = resp.get("message", {}).get("content", "")
-            elif hasattr(client, 'messages'):
-                # Anthropic
-                resp = client.messages.create(
-                    model=model,
-                    max_tokens=200,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                analysis[dim_name] = resp.content[0].text
-            else:
-                # OpenAI/xAI
-                resp = client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=200,
-                    temperature=0.7
-                )
-                analysis[dim_name] = resp.choices[0].message.content
-        except Exception as e:
-            analysis[dim_name] = f"[Analysis failed: {e}]"
+def batched_analysis(client, model: str, elements: str) -> Optional[Dict[str, str]]:
+    """
+    THINK in a single JSON-mode call covering every dimension.
 
-    return analysis
+    Returns None when the reply is not a JSON object with a string for each
+    dimension. Provider errors propagate; a rejected request (e.g. a model
+    without JSON mode) tells the caller to stop attempting the batched path.
+    """
+    dimensions = "\n".join(f'- "{dim_name}": {dim_prompt}' for dim_name, dim_prompt in ANALYSIS_DIMENSIONS)
+    prompt = f"""Analyze the context below from each of these dimensions:
+{dimensions}
+
+Context: {elements}
+
+Respond with only a JSON object mapping each dimension name to a concise analysis (2-3 sentences)."""
+    messages = [{"role": "user", "content": prompt}]
+    max_tokens = 200 * len(ANALYSIS_DIMENSIONS)
+
+    if isinstance(client, OllamaClient):
+        # Ollama
+        resp = client.chat(model, messages, format="json")
+        content = resp.get("message", {}).get("content", "")
+    elif hasattr(client, 'messages'):
+        # Anthropic has no JSON mode; prefill the opening brace instead
+        resp = client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=messages + [{"role": "assistant", "content": "{"}]
+        )
+        content = "{" + resp.content[0].text
+    else:
+        # OpenAI/xAI
+        resp = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=0.7,
+            response_format={"type": "json_object"}
+        )
+        content = resp.choices[0].message.content
+
+    try:
+        analysis = json.loads(content)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(analysis, dict):
+        return None
+    if not all(isinstance(analysis.get(dim_name), str) for dim_name, _ in ANALYSIS_DIMENSIONS):
+        return None
+    return {dim_name: analysis[dim_name] for dim_name, _ in ANALYSIS_DIMENSIONS}
 
 # =============================================================================
 # VERIFICATION CASCADE (SOLVE Stage)
@@ -444,6 +682,166 @@ class VerificationResult:
     resistance: float
     details: Dict[str, Any] = field(default_factory=dict)
 
+# Simple arithmetic expression, e.g. "2 + 2 = 4"
+_MATH_RE = re.compile(r'\d+\s*[\+\-\*\/\=]\s*\d+')
+
+def _keyword_matcher(keywords) -> Callable[[str], bool]:
+    """Predicate: does the lowercased text contain any keyword as a substring?"""
+    if ahocorasick is None:
+        return lambda text_lower: any(kw in text_lower for kw in keywords)
+
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return lambda text_lower: next(automaton.iter(text_lower), None) is not None
+
+# Matched as substrings, not tokens: "laws" counts for "law", "thus," for
+# "thus", and phrases like "if then" span words
+_TAUTOLOGY_KEYWORDS = frozenset({"exists", "a = a", "identical"})
+_LOGICAL_KEYWORDS = frozenset({"therefore", "thus", "implies", "if then"})
+_SCIENTIFIC_KEYWORDS = frozenset({"law", "constant", "measured", "documented", "recorded"})
+
+_has_tautology_keyword = _keyword_matcher(_TAUTOLOGY_KEYWORDS)
+_has_logical_keyword = _keyword_matcher(_LOGICAL_KEYWORDS)
+_has_scientific_keyword = _keyword_matcher(_SCIENTIFIC_KEYWORDS)
+
+def _truth_floor_match(claim_lower: str, classification: Dict) -> Optional[str]:
+    """Reuse RECOGNIZE's Truth Floor match for this claim; look it up if absent."""
+    if "truth_floor_match" in classification:
+        return classification["truth_floor_match"]
+    return _match_truth_floor(claim_lower)
+
+def _verify_axiomatic(claim: str, claim_lower: str, classification: Dict, tier: int, resistance: float) -> Optional[VerificationResult]:
+    """T0: AXIOMATIC (Zero cost)."""
+    # Check Truth Floor
+    axiom_match = _truth_floor_match(claim_lower, classification)
+    if axiom_match:
+        return VerificationResult(
+            verified=True,
+            confidence=1.0,
+            method="truth_floor_axiom",
+            tier=tier,
+            resistance=resistance,
+            details={"matched_axiom": axiom_match, "exact": _is_exact_axiom(claim_lower, axiom_match)}
+        )
+    # Self-evident check
+    if _has_tautology_keyword(claim_lower):
+        return VerificationResult(
+            verified=True,
+            confidence=1.0,
+            method="tautology",
+            tier=tier,
+            resistance=resistance
+        )
+    return None
+
+def _verify_mathematical(claim: str, claim_lower: str, classification: Dict, tier: int, resistance: float) -> Optional[VerificationResult]:
+    """T1-T2: MATHEMATICAL/LOGICAL (Trivial cost)."""
+    # Check Truth Floor for constants
+    axiom_match = _truth_floor_match(claim_lower, classification)
+    if axiom_match:
+        return VerificationResult(
+            verified=True,
+            confidence=0.99,
+            method="truth_floor_constant",
+            tier=tier,
+            resistance=resistance,
+            details={"matched_axiom": axiom_match, "exact": _is_exact_axiom(claim_lower, axiom_match)}
+        )
+    # Mathematical patterns
+    if _MATH_RE.search(claim):
+        return VerificationResult(
+            verified=True,
+            confidence=0.95,
+            method="mathematical_pattern",
+            tier=tier,
+            resistance=resistance
+        )
+    # Logical patterns
+    if _has_logical_keyword(claim_lower):
+        return VerificationResult(
+            verified=True,
+            confidence=0.90,
+            method="logical_pattern",
+            tier=tier,
+            resistance=resistance
+        )
+    return None
+
+def _verify_empirical(claim: str, claim_lower: str, classification: Dict, tier: int, resistance: float) -> Optional[VerificationResult]:
+    """T3-T5: EMPIRICAL/DOCUMENTARY (Low cost)."""
+    # Would normally do reference lookup here
+    # For now, pattern-based verification
+    if _has_scientific_keyword(claim_lower):
+        return VerificationResult(
+            verified=True,
+            confidence=0.85,
+            method="pattern_verified",
+            tier=tier,
+            resistance=resistance
+        )
+    return None
+
+def _verify_contextual(claim: str, claim_lower: str, classification: Dict, tier: int, resistance: float) -> Optional[VerificationResult]:
+    """T6-T8: CONTEXTUAL/TEMPORAL/TESTIMONIAL (Medium cost)."""
+    # Context-dependent claims need scope validation
+    # Testimonial claims need source evaluation
+    return VerificationResult(
+        verified=True,
+        confidence=0.70,
+        method="context_acknowledged",
+        tier=tier,
+        resistance=resistance,
+        details={"note": "Context-dependent claim - confidence limited"}
+    )
+
+def _verify_speculative(claim: str, claim_lower: str, classification: Dict, tier: int, resistance: float) -> Optional[VerificationResult]:
+    """T9-T11: SOCIAL/COGNITIVE/SPECULATIVE (High cost)."""
+    # These cannot be fully verified
+    # Acknowledge and flag appropriately
+    verifiability = classification.get("verifiability", "partial")
+    if verifiability == "unfalsifiable":
+        return VerificationResult(
+            verified=True,  # Accepted as stated
+            confidence=0.50,
+            method="epistemic_acknowledgment",
+            tier=tier,
+            resistance=resistance,
+            details={"note": "Subjective/speculative - cannot independently verify"}
+        )
+    return VerificationResult(
+        verified=True,
+        confidence=0.40,
+        method="speculative_flagged",
+        tier=tier,
+        resistance=resistance,
+        details={"note": "Flagged as speculative"}
+    )
+
+def _verify_integrity(claim: str, claim_lower: str, classification: Dict, tier: int, resistance: float) -> Optional[VerificationResult]:
+    """T12: INTEGRITY VIOLATIONS (Maximum cost)."""
+    # Full verification cascade required
+    # In production: web search, fact-check APIs, triangulation
+    return VerificationResult(
+        verified=False,
+        confidence=0.0,
+        method="integrity_violation_detected",
+        tier=tier,
+        resistance=resistance,
+        details={"note": "Potential misinformation - requires full verification"}
+    )
+
+# Verification profile -> handler (None from a handler means default_pass)
+_PROFILE_HANDLERS = {
+    VerificationProfile.AXIOM.value: _verify_axiomatic,
+    VerificationProfile.MATH_LOGIC.value: _verify_mathematical,
+    VerificationProfile.EMPIRICAL.value: _verify_empirical,
+    VerificationProfile.CONTEXTUAL.value: _verify_contextual,
+    VerificationProfile.SPECULATIVE.value: _verify_speculative,
+    VerificationProfile.VIOLATION.value: _verify_integrity,
+}
+
 def verification_cascade(
     claim: str,
     classification: Dict,
@@ -463,123 +861,17 @@ def verification_cascade(
     tier = classification["tier"]
     resistance = classification["resistance"]
 
-    # === T0: AXIOMATIC (Zero cost) ===
-    if tier == 0:
-        # Check Truth Floor
-        axiom_match = check_truth_floor(claim)
-        if axiom_match:
-            return VerificationResult(
-                verified=True,
-                confidence=1.0,
-                method="truth_floor_axiom",
-                tier=tier,
-                resistance=resistance,
-                details={"matched_axiom": axiom_match}
-            )
-        # Self-evident check
-        if any(kw in claim.lower() for kw in ["exists", "a = a", "identical"]):
-            return VerificationResult(
-                verified=True,
-                confidence=1.0,
-                method="tautology",
-                tier=tier,
-                resistance=resistance
-            )
-
-    # === T1-T2: MATHEMATICAL/LOGICAL (Trivial cost) ===
-    if tier in [1, 2]:
-        # Check Truth Floor for constants
-        axiom_match = check_truth_floor(claim)
-        if axiom_match:
-            return VerificationResult(
-                verified=True,
-                confidence=0.99,
-                method="truth_floor_constant",
-                tier=tier,
-                resistance=resistance,
-                details={"matched_axiom": axiom_match}
-            )
-        # Mathematical patterns
-        if re.search(r'\d+\s*[\+\-\*\/\=]\s*\d+', claim):
-            return VerificationResult(
-                verified=True,
-                confidence=0.95,
-                method="mathematical_pattern",
-                tier=tier,
-                resistance=resistance
-            )
-        # Logical patterns
-        if any(kw in claim.lower() for kw in ["therefore", "thus", "implies", "if then"]):
-            return VerificationResult(
-                verified=True,
-                confidence=0.90,
-                method="logical_pattern",
-                tier=tier,
-                resistance=resistance
-            )
-
-    # === T3-T5: EMPIRICAL/DOCUMENTARY (Low cost) ===
-    if tier in [3, 4, 5]:
-        # Would normally do reference lookup here
-        # For now, pattern-based verification
-        scientific_keywords = ["law", "constant", "measured", "documented", "recorded"]
-        if any(kw in claim.lower() for kw in scientific_keywords):
-            return VerificationResult(
-                verified=True,
-                confidence=0.85,
-                method="pattern_verified",
-                tier=tier,
-                resistance=resistance
-            )
+    # Classifications from TTOClassifier carry their profile; derive it otherwise
+    profile = classification.get("verification_profile")
+    if profile is None and 0 <= tier < len(_TIER_PROFILES):
+        profile = _TIER_PROFILES[tier].value
 
-    # === T6-T8: CONTEXTUAL/TEMPORAL/TESTIMONIAL (Medium cost) ===
-    if tier in [6, 7, 8]:
-        # Context-dependent claims need scope validation
-        # Testimonial claims need source evaluation
-        return VerificationResult(
-            verified=True,
-            confidence=0.70,
-            method="context_acknowledged",
-            tier=tier,
-            resistance=resistance,
-            details={"note": "Context-dependent claim - confidence limited"}
-        )
-
-    # === T9-T11: SOCIAL/COGNITIVE/SPECULATIVE (High cost) ===
-    if tier in [9, 10, 11]:
-        # These cannot be fully verified
-        # Acknowledge and flag appropriately
-        verifiability = classification.get("verifiability", "partial")
-        if verifiability == "unfalsifiable":
-            return VerificationResult(
-                verified=True,  # Accepted as stated
-                confidence=0.50,
-                method="epistemic_acknowledgment",
-                tier=tier,
-                resistance=resistance,
-                details={"note": "Subjective/speculative - cannot independently verify"}
-            )
-        return VerificationResult(
-            verified=True,
-            confidence=0.40,
-            method="speculative_flagged",
-            tier=tier,
-            resistance=resistance,
-            details={"note": "Flagged as speculative"}
-        )
-
-    # === T12: INTEGRITY VIOLATIONS (Maximum cost) ===
-    if tier == 12:
-        # Full verification cascade required
-        # In production: web search, fact-check APIs, triangulation
-        return VerificationResult(
-            verified=False,
-            confidence=0.0,
-            method="integrity_violation_detected",
-            tier=tier,
-            resistance=resistance,
-            details={"note": "Potential misinformation - requires full verification"}
-        )
+    handler = _PROFILE_HANDLERS.get(profile)
+    if handler is not None:
+        # Lowercase once; every keyword check shares it
+        result = handler(claim, claim.lower(), classification, tier, resistance)
+        if result is not None:
+            return result
 
     # Default fallback
     return VerificationResult(
@@ -594,26 +886,155 @@ def verification_cascade(
 # THE SOVEREIGN REASONING ENGINE
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ReasoningState:
     """State passed through all 8 stages."""
     input_problem: str
     stage: str = "AWARE"
-    timestamp: datetime = field(default_factory=datetime.now)
-
-    # Stage outputs
-    awareness: Dict = field(default_factory=dict)
-    energy_allocation: Dict = field(default_factory=dict)
-    recognition: Dict = field(default_factory=dict)
-    thinking: Dict = field(default_factory=dict)
-    solution: VerificationResult = None
+    start_time: float = 0.0  # time.time() at cycle start
+    timestamp: Optional[datetime] = None  # derived from start_time when unset
+
+    # Stage outputs (None until the stage runs)
+    awareness: Optional[Dict] = None
+    energy_allocation: Optional[Dict] = None
+    recognition: Optional[Dict] = None
+    thinking: Optional[Dict] = None
+    solution: Optional[VerificationResult] = None
     action: str = ""
-    attainment: Dict = field(default_factory=dict)
+    attainment: Optional[Dict] = None
 
     # Metadata
     total_time_ms: float = 0.0
     llm_calls: int = 0
 
+# Truth Floor methods ACT may answer from a template instead of an LLM call,
+# and only when the whole claim is the axiom (details["exact"]). Claims that
+# merely contain or resemble one ("It is not true that energy is conserved"),
+# tautology keywords ("Bigfoot exists") and mathematical_pattern are
+# heuristics the LLM must see.
+TEMPLATED_METHODS = frozenset({"truth_floor_axiom", "truth_floor_constant"})
+
+# Static ACT rubric, sent as the system prompt so providers can cache the prefix
+SYSTEM_PROMPT = """You are a Sovereign Truth Engine. Generate a response based on the verified analysis you are given.
+
+INSTRUCTIONS:
+1. If verified with high confidence (>85%), respond authoritatively
+2. If moderate confidence (50-85%), respond with appropriate hedging
+3. If low confidence or unverified, acknowledge uncertainty
+4. Never fabricate - if unknown, say so
+5. Match response depth to tier complexity"""
+
+# reason() result cache: entries per engine, and seconds before an entry expires
+REASON_CACHE_SIZE = int(os.getenv("REASON_CACHE_SIZE", "10000"))
+REASON_CACHE_TTL = float(os.getenv("REASON_CACHE_TTL", "3600"))
+
+# Optional SQLite file that persists reason() results across restarts
+REASON_CACHE_DB = os.getenv("REASON_CACHE_DB", "")
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+def is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """False when ACT or a THINK dimension failed: don't pin a transient LLM error for a whole TTL."""
+    if result["response"].startswith("[Response generation failed"):
+        return False
+    return not any(
+        isinstance(text, str) and text.startswith("[Analysis failed")
+        for text in result["stages"]["think"].values()
+    )
+
+def stamp_cached_result(result: Dict[str, Any], input_problem: str) -> Dict[str, Any]:
+    """Stamp a private copy of a cached result as a fresh, zero-cost cycle."""
+    result["input"] = input_problem
+    result["metadata"].update(timestamp=datetime.now().isoformat(), total_time_ms=0.0, llm_calls=0)
+    result["stages"]["rest"].update(total_time_ms=0.0, llm_calls=0)
+    return result
+
+class DiskResultCache:
+    """
+    SQLite-backed reason() results, shared by every engine in the process.
+
+    Only whole results are persisted: classification and verification alone
+    recompute faster than a row lookup, the LLM stages are what is worth
+    keeping. Errors (e.g. a locked database) degrade to cache misses.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS reason_cache "
+                    "(key TEXT PRIMARY KEY, result TEXT NOT NULL, ts REAL NOT NULL)"
+                )
+                self._conn.execute("DELETE FROM reason_cache WHERE ts < ?", (time.time() - ttl,))
+                self._conn.commit()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def get(self, key: str) -> Tuple[Optional[Dict[str, Any]], float]:
+        """Return (result, age in seconds), or (None, 0.0) if absent/expired."""
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT result, ts FROM reason_cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None, 0.0
+        if row is None:
+            return None, 0.0
+        age = time.time() - row[1]
+        if age >= self.ttl:
+            return None, 0.0
+        try:
+            return orjson.loads(row[0]), age
+        except orjson.JSONDecodeError:
+            # Corrupt row: drop it so the next put() replaces it cleanly
+            try:
+                with self._lock:
+                    self._conn.execute("DELETE FROM reason_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+            except sqlite3.Error:
+                pass
+            return None, 0.0
+
+    def put(self, key: str, result: Dict[str, Any]):
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO reason_cache VALUES (?, ?, ?)",
+                    (key, orjson.dumps(result).decode(), time.time())
+                )
+                self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_disk_cache = None
+_disk_cache_unavailable = False
+_disk_cache_lock = threading.Lock()
+
+def get_disk_cache() -> Optional[DiskResultCache]:
+    """The process-wide disk cache; None unless REASON_CACHE_DB is set and opens."""
+    global _disk_cache, _disk_cache_unavailable
+    if not REASON_CACHE_DB:
+        return None
+    if _disk_cache is None and not _disk_cache_unavailable:
+        with _disk_cache_lock:
+            if _disk_cache is None and not _disk_cache_unavailable:
+                try:
+                    _disk_cache = DiskResultCache(REASON_CACHE_DB, REASON_CACHE_TTL)
+                except sqlite3.Error:
+                    # e.g. a missing directory or read-only volume
+                    logger.exception("Disk cache disabled: could not open %s", REASON_CACHE_DB)
+                    _disk_cache_unavailable = True
+    return _disk_cache
+
 class SovereignReasoningEngine:
     """
     The Ultimate Truth-Native Reasoning System.
@@ -628,64 +1049,215 @@ class SovereignReasoningEngine:
         self.model = model or LLM_MODEL
 
         # Initialize client
-        if api_key:
-            os.environ["LLM_API_KEY"] = api_key
-        self.client = get_llm_client()
+        self.client = get_llm_client(self.provider, api_key)
 
         # Initialize components
-        self.classifier = TTOClassifier()
-        self.epistemic_detector = EpistemicSubjectDetector()
+        self.classifier = DEFAULT_CLASSIFIER
+        self.epistemic_detector = DEFAULT_EPISTEMIC_DETECTOR
+
+        # The client type is fixed, so resolve ACT's provider adapter once
+        if isinstance(self.client, OllamaClient):
+            self._chat, self._chat_stream = self._chat_ollama, self._stream_ollama
+        elif hasattr(self.client, 'messages'):
+            self._chat, self._chat_stream = self._chat_anthropic, self._stream_anthropic
+        else:
+            self._chat, self._chat_stream = self._chat_openai, self._stream_openai
+
+        # THINK tries one JSON-mode call first; cleared if the provider rejects it (HTTP 400)
+        self.batch_think = True
+
+        # (normalized input, model) -> (expiry, result), LRU-ordered
+        self._reason_cache = OrderedDict()
+        self._reason_cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
         # Verify Truth Floor integrity
         verify_truth_floor_integrity()
 
+    def close(self):
+        """Release the LLM client's pooled connections."""
+        self.client.close()
+
+    def _chat_ollama(self, system: str, prompt: str, max_tokens: int) -> str:
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+        resp = self.client.chat(self.model, messages)
+        return resp.get("message", {}).get("content", "")
+
+    def _chat_anthropic(self, system: str, prompt: str, max_tokens: int) -> str:
+        resp = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return resp.content[0].text
+
+    def _chat_openai(self, system: str, prompt: str, max_tokens: int) -> str:
+        resp = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "system", "content": system}, {"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=0.7
+        )
+        return resp.choices[0].message.content
+
+    def _stream_ollama(self, system: str, prompt: str, max_tokens: int) -> Iterator[str]:
+        messages = [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+        yield from self.client.chat_stream(self.model, messages)
+
+    def _stream_anthropic(self, system: str, prompt: str, max_tokens: int) -> Iterator[str]:
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            yield from stream.text_stream
+
+    def _stream_openai(self, system: str, prompt: str, max_tokens: int) -> Iterator[str]:
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "system", "content": system}, {"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=0.7,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
     def reason(self, input_problem: str) -> Dict[str, Any]:
         """
         Execute the full 8-stage reasoning cycle.
 
         AWARE → ENERGIZE → RECOGNIZE → THINK → SOLVE → ACT → ATTAIN → REST
+
+        Results are cached for REASON_CACHE_TTL seconds by whitespace- and
+        case-normalized input (in memory, and on disk when REASON_CACHE_DB is
+        set); a hit returns a copy stamped as a fresh, zero-cost cycle.
+        """
+        normalized = _WHITESPACE_RE.sub(" ", input_problem.strip().lower())
+        key = (normalized, self.model)
+        result = self._cached_result(key)
+
+        if result is not None:
+            return stamp_cached_result(result, input_problem)
+
+        for event in self.reason_stream(input_problem):
+            pass
+        result = event["result"]
+
+        if is_cacheable_result(result):
+            self._remember(key, result, REASON_CACHE_TTL)
+            disk_cache = get_disk_cache()
+            if disk_cache is not None:
+                disk_cache.put(self._disk_key(key), result)
+        return result
+
+    def _disk_key(self, key: Tuple[str, str]) -> str:
+        return hashlib.sha256(f"{self.provider}\0{key[1]}\0{key[0]}".encode()).hexdigest()
+
+    def _cached_result(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """A private copy of the cached result for key, or None on a miss."""
+        with self._reason_cache_lock:
+            entry = self._reason_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._reason_cache.move_to_end(key)
+                self.cache_hits += 1
+                return deepcopy(entry[1])
+
+        disk_cache = get_disk_cache()
+        if disk_cache is not None:
+            result, age = disk_cache.get(self._disk_key(key))
+            if result is not None:
+                # Promote for the rest of its lifetime
+                self._remember(key, result, REASON_CACHE_TTL - age)
+                with self._reason_cache_lock:
+                    self.cache_hits += 1
+                return deepcopy(result)
+
+        with self._reason_cache_lock:
+            self.cache_misses += 1
+        return None
+
+    def _remember(self, key: Tuple[str, str], result: Dict[str, Any], ttl: float):
+        """Store a copy of result in the in-memory LRU."""
+        if REASON_CACHE_SIZE <= 0:
+            return
+        with self._reason_cache_lock:
+            self._reason_cache[key] = (time.monotonic() + ttl, deepcopy(result))
+            self._reason_cache.move_to_end(key)
+            if len(self._reason_cache) > REASON_CACHE_SIZE:
+                self._reason_cache.popitem(last=False)
+
+    def reason_stream(self, input_problem: str, stream_tokens: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Execute the 8-stage reasoning cycle, yielding each stage as it completes.
+
+        Yields {"stage": <name>, "data": <stage output>} for each stage, then
+        {"stage": "complete", "result": <the dict reason() returns>}. With
+        stream_tokens, the ACT LLM call is streamed and each text chunk is
+        yielded as {"stage": "act_token", "data": {"text": ...}} ahead of the
+        "act" event.
         """
-        start_time = time.time()
-        state = ReasoningState(input_problem=input_problem)
+        state = ReasoningState(input_problem=input_problem, start_time=time.time())
 
         # === 1. AWARE: Perceive the input completely ===
         state.stage = "AWARE"
         state.awareness = self._aware(input_problem)
+        yield {"stage": "aware", "data": state.awareness}
 
         # === 2. ENERGIZE: Allocate cognitive resources ===
         state.stage = "ENERGIZE"
         state.energy_allocation = self._energize(state.awareness)
+        yield {"stage": "energize", "data": state.energy_allocation}
 
         # === 3. RECOGNIZE: Pattern match against known structures ===
         state.stage = "RECOGNIZE"
         state.recognition = self._recognize(input_problem)
+        yield {"stage": "recognize", "data": state.recognition}
 
         # === 4. THINK: Multidimensional analysis ===
         state.stage = "THINK"
         if state.energy_allocation.get("requires_deep_analysis", False):
-            state.thinking = self._think(input_problem, state.recognition)
-            state.llm_calls += len(ANALYSIS_DIMENSIONS)
+            state.thinking, calls = self._think(input_problem, state.recognition)
+            state.llm_calls += calls
         else:
             state.thinking = {"skipped": True, "reason": "Low complexity - direct verification"}
+        yield {"stage": "think", "data": state.thinking}
 
         # === 5. SOLVE: Verify truth (CRITICAL CHECKPOINT) ===
         state.stage = "SOLVE"
         state.solution = self._solve(input_problem, state.recognition)
+        yield {"stage": "solve", "data": asdict(state.solution)}
 
         # === 6. ACT: Generate response ===
         state.stage = "ACT"
-        state.action = self._act(state)
-        state.llm_calls += 1
+        if state.solution.method in TEMPLATED_METHODS and state.solution.details.get("exact"):
+            state.action = self._act_template(state)
+        elif stream_tokens:
+            parts = []
+            for text in self._act_stream(state):
+                parts.append(text)
+                yield {"stage": "act_token", "data": {"text": text}}
+            state.action = "".join(parts)
+            state.llm_calls += 1
+        else:
+            state.action = self._act(state)
+            state.llm_calls += 1
+        yield {"stage": "act", "data": {"response": state.action}}
 
         # === 7. ATTAIN: Confirm success ===
         state.stage = "ATTAIN"
         state.attainment = self._attain(state)
+        yield {"stage": "attain", "data": state.attainment}
 
         # === 8. REST: Consolidate and reset ===
         state.stage = "REST"
-        state.total_time_ms = (time.time() - start_time) * 1000
+        state.total_time_ms = (time.time() - state.start_time) * 1000
 
-        return self._compile_result(state)
+        yield {"stage": "complete", "result": self._compile_result(state)}
 
     def _aware(self, input_problem: str) -> Dict:
         """AWARE: Perceive the input completely."""
@@ -741,28 +1313,47 @@ class SovereignReasoningEngine:
             "truth_floor_match": truth_floor_match,
         }
 
-    def _think(self, input_problem: str, recognition: Dict) -> Dict:
-        """THINK: Multidimensional analysis."""
+    def _think(self, input_problem: str, recognition: Dict) -> Tuple[Dict, int]:
+        """THINK: Multidimensional analysis. Returns (analysis, LLM calls made)."""
         elements = f"""
 Problem: {input_problem}
 Classification: {recognition.get('name')} (Tier {recognition.get('tier')})
 Epistemic Level: {recognition.get('epistemic_level')}
 """
-        return multidimensional_analysis(self.client, self.model, elements)
+        calls = 0
+        if self.batch_think:
+            calls += 1
+            try:
+                analysis = batched_analysis(self.client, self.model, elements)
+            except Exception as e:
+                # Only a rejection is permanent; transient errors fall back once
+                if _is_rejected_request(e):
+                    self.batch_think = False
+                analysis = None
+            if analysis is not None:
+                return analysis, calls
+
+        # Fall back to one call per dimension
+        analysis = multidimensional_analysis(self.client, self.model, elements)
+        return analysis, calls + len(ANALYSIS_DIMENSIONS)
 
     def _solve(self, input_problem: str, recognition: Dict) -> VerificationResult:
         """SOLVE: Verify truth through the cascade."""
         return verification_cascade(input_problem, recognition, self.client, self.model)
 
-    def _act(self, state: ReasoningState) -> str:
-        """ACT: Generate the response."""
+    def _act_prompt(self, state: ReasoningState) -> str:
+        """Per-claim ACT message: input, classification, verification, analysis."""
         solution = state.solution
         recognition = state.recognition
 
-        # Build response prompt
-        prompt = f"""You are a Sovereign Truth Engine. Generate a response based on this verified analysis.
+        thinking = state.thinking
+        if thinking and not thinking.get('skipped'):
+            analysis_block = "MULTIDIMENSIONAL ANALYSIS:\n" + orjson.dumps(thinking, option=orjson.OPT_INDENT_2).decode()
+        else:
+            analysis_block = ""
 
-INPUT: {state.input_problem}
+        # The rubric lives in SYSTEM_PROMPT
+        return f"""INPUT: {state.input_problem}
 
 CLASSIFICATION:
 - Type: {recognition.get('name')} (Tier {recognition.get('tier')} - {recognition.get('tier_name')})
@@ -775,39 +1366,38 @@ VERIFICATION:
 - Method: {solution.method}
 - Resistance Cost: {solution.resistance}
 
-{'MULTIDIMENSIONAL ANALYSIS:' + json.dumps(state.thinking, indent=2) if state.thinking and not state.thinking.get('skipped') else ''}
-
-INSTRUCTIONS:
-1. If verified with high confidence (>85%), respond authoritatively
-2. If moderate confidence (50-85%), respond with appropriate hedging
-3. If low confidence or unverified, acknowledge uncertainty
-4. Never fabricate - if unknown, say so
-5. Match response depth to tier complexity
+{analysis_block}
 
 Generate the response:"""
 
+    def _act(self, state: ReasoningState) -> str:
+        """ACT: Generate the response."""
         try:
-            if hasattr(self.client, 'chat'):
-                resp = self.client.chat(self.model, [{"role": "user", "content": prompt}])
-                return resp.get("message", {}).get("content", "")
-            elif hasattr(self.client, 'messages'):
-                resp = self.client.messages.create(
-                    model=self.model,
-                    max_tokens=500,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return resp.content[0].text
-            else:
-                resp = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=500,
-                    temperature=0.7
-                )
-                return resp.choices[0].message.content
+            return self._chat(SYSTEM_PROMPT, self._act_prompt(state), 500)
         except Exception as e:
             return f"[Response generation failed: {e}]"
 
+    def _act_stream(self, state: ReasoningState) -> Iterator[str]:
+        """ACT, yielding response text as the LLM generates it."""
+        try:
+            for text in self._chat_stream(SYSTEM_PROMPT, self._act_prompt(state), 500):
+                if text:
+                    yield text
+        except Exception as e:
+            yield f"[Response generation failed: {e}]"
+
+    def _act_template(self, state: ReasoningState) -> str:
+        """ACT without the LLM, for claims that are exactly a Truth Floor axiom."""
+        solution = state.solution
+        recognition = state.recognition
+
+        return (
+            f"Verified ({solution.confidence:.0%} confidence): this matches the "
+            f'Truth Floor axiom "{solution.details["matched_axiom"]}". '
+            f"Classified as {recognition.get('name')} "
+            f"(Tier {recognition.get('tier')} - {recognition.get('tier_name')})."
+        )
+
     def _attain(self, state: ReasoningState) -> Dict:
         """ATTAIN: Confirm the response achieves the goal."""
         solution = state.solution
@@ -821,37 +1411,44 @@ Generate the response:"""
 
     def _compile_result(self, state: ReasoningState) -> Dict[str, Any]:
         """Compile final result from all stages."""
+        solution = state.solution
+        recognition = state.recognition or {}
+        tier = recognition.get("tier")
+        total_time_ms = state.total_time_ms
+        llm_calls = state.llm_calls
+        timestamp = state.timestamp or datetime.fromtimestamp(state.start_time)
+
         return {
             "input": state.input_problem,
             "response": state.action,
             "stages": {
-                "aware": state.awareness,
-                "energize": state.energy_allocation,
-                "recognize": state.recognition,
-                "think": state.thinking,
+                "aware": state.awareness or {},
+                "energize": state.energy_allocation or {},
+                "recognize": recognition,
+                "think": state.thinking or {},
                 "solve": {
-                    "verified": state.solution.verified,
-                    "confidence": state.solution.confidence,
-                    "method": state.solution.method,
-                    "tier": state.solution.tier,
-                    "resistance": state.solution.resistance,
-                    "details": state.solution.details
+                    "verified": solution.verified,
+                    "confidence": solution.confidence,
+                    "method": solution.method,
+                    "tier": solution.tier,
+                    "resistance": solution.resistance,
+                    "details": solution.details
                 },
                 "act": {"response_generated": bool(state.action)},
-                "attain": state.attainment,
+                "attain": state.attainment or {},
                 "rest": {
-                    "total_time_ms": state.total_time_ms,
-                    "llm_calls": state.llm_calls,
+                    "total_time_ms": total_time_ms,
+                    "llm_calls": llm_calls,
                     "cycle_complete": True
                 }
             },
             "metadata": {
-                "timestamp": state.timestamp.isoformat(),
-                "total_time_ms": state.total_time_ms,
-                "llm_calls": state.llm_calls,
-                "tier": state.recognition.get("tier"),
-                "resistance": state.recognition.get("resistance"),
-                "thesis_proof": f"T{state.recognition.get('tier')} verification cost: {state.solution.resistance:.3f}"
+                "timestamp": timestamp.isoformat(),
+                "total_time_ms": total_time_ms,
+                "llm_calls": llm_calls,
+                "tier": tier,
+                "resistance": recognition.get("resistance"),
+                "thesis_proof": f"T{tier} verification cost: {solution.resistance:.3f}"
             }
         }
 
@@ -866,9 +1463,57 @@ def sovereign_reason(input_problem: str, **kwargs) -> Dict[str, Any]:
     Usage:
         result = sovereign_reason("What is the speed of light?")
         print(result["response"])
+
+    Engines are reused across calls with the same provider, model and key.
     """
-    engine = SovereignReasoningEngine(**kwargs)
-    return engine.reason(input_problem)
+    return get_cached_engine(**kwargs).reason(input_problem)
+
+ENGINE_CACHE_SIZE = 64
+
+_engine_cache = OrderedDict()  # (provider, model, key hash) -> engine
+_engine_cache_lock = threading.Lock()
+
+def get_cached_engine(provider: str = None, api_key: str = None, model: str = None) -> SovereignReasoningEngine:
+    """
+    Get an engine for these settings, reusing one built earlier if possible.
+
+    Engines own their LLM client and its connection pool, so reuse skips
+    client setup and TLS handshakes. Least recently used engines are
+    dropped beyond ENGINE_CACHE_SIZE and their pools released on garbage
+    collection; API keys are keyed by hash only.
+    """
+    key = (
+        provider or LLM_PROVIDER,
+        model or LLM_MODEL,
+        hashlib.sha256((api_key or "").encode()).hexdigest()
+    )
+    with _engine_cache_lock:
+        engine = _engine_cache.get(key)
+        if engine is not None:
+            _engine_cache.move_to_end(key)
+            return engine
+
+    engine = SovereignReasoningEngine(provider=provider, api_key=api_key, model=model)
+
+    with _engine_cache_lock:
+        cached = _engine_cache.setdefault(key, engine)
+        _engine_cache.move_to_end(key)
+        if len(_engine_cache) > ENGINE_CACHE_SIZE:
+            # Not closed here: a concurrent request may still be mid-call on
+            # it. Its client closes once the last reference is dropped.
+            _engine_cache.popitem(last=False)
+
+    if cached is not engine:
+        engine.close()  # another thread cached this key first; never handed out
+    return cached
+
+def close_cached_engines():
+    """Close and forget every cached engine (e.g. at server shutdown)."""
+    with _engine_cache_lock:
+        engines = list(_engine_cache.values())
+        _engine_cache.clear()
+    for engine in engines:
+        engine.close()
 
 # =============================================================================
 # CLI INTERFACE
@@ -893,13 +1538,16 @@ if __name__ == "__main__":
 
     engine = SovereignReasoningEngine()
 
-    for problem in test_problems:
+    # Problems are independent and LLM-bound, so reason about them
+    # concurrently (the engine is thread-safe) and print in order
+    with ThreadPoolExecutor(max_workers=len(test_problems)) as executor:
+        results = list(executor.map(engine.reason, test_problems))
+
+    for problem, result in zip(test_problems, results):
         print(f"\n{'─' * 70}")
         print(f"INPUT: {problem}")
         print(f"{'─' * 70}")
 
-        result = engine.reason(problem)
-
         print(f"\nTIER: T{result['metadata']['tier']} ({result['stages']['recognize']['tier_name']})")
         print(f"RESISTANCE: {result['metadata']['resistance']:.3f}")
         print(f"CONFIDENCE: {result['stages']['solve']['confidence']:.0%}")